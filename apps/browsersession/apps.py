@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BrowsersessionConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.browsersession"
+
+    def ready(self):
+        from apps.browsersession import signals  # noqa: F401
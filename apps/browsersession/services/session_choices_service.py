@@ -0,0 +1,35 @@
+"""
+Session choices service: build the per-user browser session dropdown list and
+keep it in the Django cache. Entries are invalidated by the BrowserSession
+post_save/post_delete signals (see apps.browsersession.signals).
+"""
+
+from typing import Dict, List
+
+from django.core.cache import cache
+
+# Upper bound on staleness if an invalidation is ever missed
+SESSION_CHOICES_CACHE_TIMEOUT = 60
+
+
+def _cache_key(user_id) -> str:
+    return f"browsersession:choices:{user_id}"
+
+
+def get_session_choices(user) -> List[Dict[str, str]]:
+    """Return [{'id', 'name'}] for the user's sessions, served from cache when possible."""
+    from apps.browsersession.models import BrowserSession
+
+    key = _cache_key(user.pk)
+    choices = cache.get(key)
+    if choices is None:
+        sessions = BrowserSession.objects.filter(created_by=user).values('id', 'name')
+        choices = [{'id': str(s['id']), 'name': s['name']} for s in sessions]
+        cache.set(key, choices, SESSION_CHOICES_CACHE_TIMEOUT)
+    return choices
+
+
+def invalidate_session_choices(user_id) -> None:
+    """Drop the cached choices for a user (no-op when user_id is None)."""
+    if user_id is not None:
+        cache.delete(_cache_key(user_id))
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.browsersession.models import BrowserSession
+from apps.browsersession.services.session_choices_service import invalidate_session_choices
+
+
+@receiver(post_save, sender=BrowserSession)
+@receiver(post_delete, sender=BrowserSession)
+def invalidate_browser_session_choices(sender, instance, **kwargs):
+    """Keep cached session choices in sync with the owner's sessions."""
+    invalidate_session_choices(instance.created_by_id)
@@ -20,6 +20,7 @@ from apps.browsersession.serializers import (
     PoolDomainThrottleRuleSerializer,
     PoolDomainThrottleRuleCreateSerializer,
 )
+from apps.browsersession.services.session_choices_service import get_session_choices
 from rest_framework.decorators import action
 
 
@@ -29,9 +30,7 @@ class BrowserSessionChoicesView(APIView):
 
     def get(self, request):
         """Return session choices for dropdown/select fields in forms (scoped to current user)."""
-        sessions = BrowserSession.objects.filter(created_by=request.user).values('id', 'name')
-        choices = [{'id': str(s['id']), 'name': s['name']} for s in sessions]
-        return Response(choices)
+        return Response(get_session_choices(request.user))
 
 
 class BrowserSessionViewSet(ModelViewSet):
@@ -63,9 +62,9 @@ class BrowserSessionViewSet(ModelViewSet):
             # Create directories if they don't exist
             try:
                 os.makedirs(str(session_dir), exist_ok=True)
-            except Exception as e:
+            except OSError:
                 # Log error but don't fail the request
-                logger.error("Error creating session directory", session_id=session_id, error=str(e), exc_info=True)
+                logger.exception("Error creating session directory", session_id=session_id)
         
         # Create response using the full serializer (which includes id)
         headers = self.get_success_headers(serializer.data)
@@ -77,17 +76,18 @@ class BrowserSessionViewSet(ModelViewSet):
         instance = self.get_object()
         session_id = instance.id
         
-        # Delete session directory if it exists
+        # Delete session directory (a missing directory is not an error)
         if session_id:
             sessions_dir = settings.BASE_DIR / 'data' / 'Browser'
             session_dir = sessions_dir / str(session_id)
             
             try:
-                if os.path.exists(str(session_dir)):
-                    shutil.rmtree(str(session_dir))
-            except Exception as e:
+                shutil.rmtree(session_dir)
+            except FileNotFoundError:
+                pass
+            except OSError:
                 # Log error but don't fail the request
-                logger.error("Error deleting session directory", session_id=session_id, error=str(e), exc_info=True)
+                logger.exception("Error deleting session directory", session_id=session_id)
         
         # Delete the session instance
         return super().destroy(request, *args, **kwargs)
@@ -107,9 +107,7 @@ class BrowserSessionViewSet(ModelViewSet):
     @action(detail=False, methods=['get'])
     def choices(self, request):
         """Return session choices for dropdown/select fields in forms (scoped to current user)."""
-        sessions = BrowserSession.objects.filter(created_by=request.user).values('id', 'name')
-        choices = [{'id': str(s['id']), 'name': s['name']} for s in sessions]
-        return Response(choices)
+        return Response(get_session_choices(request.user))
     
     @action(detail=True, methods=['get'])
     def config(self, request, pk=None):
@@ -11,6 +11,10 @@ from rest_framework import status
 
 from .services import get_node_services
 
+# supported_workflow_types per node class; fixed per class, and reading it
+# means building a throwaway node (and its form), so do that once per class.
+_workflow_types_by_class = {}
+
 
 class NodeListView(APIView):
     """
@@ -384,6 +388,10 @@ def _get_node_supported_workflow_types(node: dict) -> list:
             # Fallback: assume all types supported for backward compatibility
             return ['production', 'api']
         
+        cached = _workflow_types_by_class.get(node_class)
+        if cached is not None:
+            return cached
+        
         # Create a dummy instance to access the property
         from core.Node.Core.Node.Core.Data import NodeConfig, NodeConfigData
         
@@ -396,13 +404,14 @@ def _get_node_supported_workflow_types(node: dict) -> list:
         instance = node_class(dummy_config)
         
         # Get supported_workflow_types property
+        workflow_types = ['production', 'api']  # Fallback: assume all types supported
         if hasattr(instance, 'supported_workflow_types'):
-            workflow_types = instance.supported_workflow_types
-            if workflow_types is not None and len(workflow_types) > 0:
-                return workflow_types
+            supported = instance.supported_workflow_types
+            if supported is not None and len(supported) > 0:
+                workflow_types = supported
         
-        # Fallback: assume all types supported
-        return ['production', 'api']
+        _workflow_types_by_class[node_class] = workflow_types
+        return workflow_types
         
     except Exception:
         # On any error, assume all types supported for backward compatibility
@@ -40,21 +40,25 @@ class BaseForm(Form, metaclass=DependencyFormMetaClass):
 
     def _set_multiple_field_values(self, field_data):
         """Set multiple field values at once."""
-        for field_name, value in field_data.items():
-            self._set_field_value(field_name, value)
-        return set(field_data.keys())
+        self._field_values.update(field_data)
+        return set(field_data)
 
     # ==================== Dependency Checking Methods ====================
 
+    def _get_dependencies(self, field_name):
+        """Return the fields a field depends on (empty tuple for independent fields)."""
+        meta = self._field_dependencies.get(field_name)
+        return meta.dependent_on if meta is not None else ()
+
     def _are_dependencies_satisfied(self, field_name):
         """Check if all dependencies for a field have values."""
-        dependencies = self._field_dependencies.get(field_name, {}).get("dependent_on", [])
-        return all(dep in self._field_values for dep in dependencies)
+        field_values = self._field_values
+        return all(dep in field_values for dep in self._get_dependencies(field_name))
 
     def _get_dependency_values(self, field_name):
         """Extract dependency values for a field in order."""
-        dependencies = self._field_dependencies.get(field_name, {}).get("dependent_on", [])
-        return [self._field_values[dep] for dep in dependencies]
+        field_values = self._field_values
+        return [field_values[dep] for dep in self._get_dependencies(field_name)]
 
     def _should_skip_loader(self, dep_field, provided_fields):
         """Determine if loader should be skipped for a dependent field."""
@@ -66,11 +70,10 @@ class BaseForm(Form, metaclass=DependencyFormMetaClass):
 
     def _call_field_loader(self, dep_field, meta):
         """Call the loader function for a dependent field."""
-        loader = meta["loader"]
-        return loader(self)
+        return meta.loader(self)
 
     def _populate_field_choices(self, dep_field, choices, provided_fields=None):
-        """Set choices for a field, auto-select if single choice, and update dependents."""
+        """Set choices for a field and auto-select if single choice."""
         # Clear stale value unless user just provided it in this update
         if dep_field not in (provided_fields or set()):
             self._field_values.pop(dep_field, None)
@@ -80,14 +83,29 @@ class BaseForm(Form, metaclass=DependencyFormMetaClass):
         # Auto-select if exactly one choice and not user-provided
         if len(choices) == 1 and dep_field not in (provided_fields or set()):
             self._set_field_value(dep_field, choices[0][0])
-        
-        self._update_dependents(dep_field, provided_fields=provided_fields)
 
     def _clear_dependent_field(self, dep_field):
         """Clear choices AND value when dependencies not met."""
         self.fields[dep_field].choices = []
         self._field_values.pop(dep_field, None)
 
+    def _collect_dependents(self, field_names):
+        """
+        Return every field downstream of field_names.
+        
+        The metaclass guarantees _dependency_order is acyclic and topologically
+        sorted, so one forward scan reaches each descendant after its parents,
+        with no visited-set or queue bookkeeping.
+        """
+        field_dependencies = self._field_dependencies
+        reached = set(field_names)
+        found = set()
+        for dep_field in self._dependency_order:
+            if not reached.isdisjoint(field_dependencies[dep_field].dependent_on):
+                reached.add(dep_field)
+                found.add(dep_field)
+        return found
+
     def _load_all_choices(self):
         """Load choices for ALL dependent fields without modifying values.
         Called before validation to ensure choices are available.
@@ -122,9 +140,8 @@ class BaseForm(Form, metaclass=DependencyFormMetaClass):
         # Set all provided field values
         provided_fields = self._set_multiple_field_values(field_data)
         
-        # Update dependents for all changed fields with smart loader logic
-        for field_name in provided_fields:
-            self._update_dependents(field_name, provided_fields=provided_fields)
+        # Update dependents of all changed fields in one pass with smart loader logic
+        self._update_dependents(provided_fields, provided_fields=provided_fields)
 
     def validate_form(self):
         """
@@ -154,31 +171,39 @@ class BaseForm(Form, metaclass=DependencyFormMetaClass):
         
         return is_valid
 
-    def _update_dependents(self, field_name, provided_fields=None):
+    def _update_dependents(self, changed_fields, provided_fields=None):
         """
-        Recursively update dependent fields with smart loader skipping.
+        Update every field downstream of the changed fields with smart loader skipping.
+        
+        Walks the class-level _dependency_order once, so each affected field is
+        processed a single time and only after all of its parents are settled.
+        Clearing and reloading happen in the same walk: once a field is cleared,
+        its descendants come later in the order with unmet dependencies and are
+        cleared in turn.
         
         Args:
-            field_name: Field that was updated
+            changed_fields: Fields that were updated
             provided_fields: Set of fields with user-provided values (None = always load)
         """
-        for dep_field, meta in self._field_dependencies.items():
-            if field_name not in meta["dependent_on"]:
+        pending = self._collect_dependents(changed_fields)
+        if not pending:
+            return
+        
+        for dep_field in self._dependency_order:
+            if dep_field not in pending:
                 continue
-
+            
             if self._are_dependencies_satisfied(dep_field):
                 # Dependencies satisfied - check if we should skip loader
                 if self._should_skip_loader(dep_field, provided_fields):
-                    # User provided value, skip loader, just recurse to update dependents
-                    self._update_dependents(dep_field, provided_fields=provided_fields)
-                else:
-                    # Need to call loader
-                    choices = self._call_field_loader(dep_field, meta)
-                    self._populate_field_choices(dep_field, choices, provided_fields=provided_fields)
+                    # User provided value, skip loader (its dependents are already pending)
+                    continue
+                # Need to call loader
+                choices = self._call_field_loader(dep_field, self._field_dependencies[dep_field])
+                self._populate_field_choices(dep_field, choices, provided_fields=provided_fields)
             else:
-                # Dependencies not met, clear choices AND value, then recurse for full cascade
+                # Dependencies not met, clear choices AND value (descendants follow in order)
                 self._clear_dependent_field(dep_field)
-                self._update_dependents(dep_field, provided_fields=provided_fields)
 
     # ==================== Schema Generation ====================
 
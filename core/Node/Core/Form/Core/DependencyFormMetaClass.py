@@ -1,5 +1,6 @@
+from collections import deque
 from django.forms.fields import Field
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Tuple
 from django.forms.forms import DeclarativeFieldsMetaclass
 
 from .exceptions import (
@@ -7,9 +8,16 @@ from .exceptions import (
     SelfReferenceError,
     MissingLoaderError,
     NonCallableLoaderError,
+    CircularDependencyError,
 )
 
 
+class FieldDependency(NamedTuple):
+    """Dependency metadata for one dependent field (values of `_field_dependencies`)."""
+    dependent_on: Tuple[str, ...]
+    loader: Callable[[Any], Any]
+
+
 
 
 class DependencyFormMetaClass(DeclarativeFieldsMetaclass):
@@ -26,7 +34,11 @@ class DependencyFormMetaClass(DeclarativeFieldsMetaclass):
     3. Prevents self-referential dependencies
     4. Resolves loader functions (either from field.loader or {field_name}_loader method)
     5. Creates a `_field_dependencies` dictionary mapping field names to their
-       dependency metadata (dependent_on list and loader function)
+       FieldDependency metadata (dependent_on tuple and loader function)
+    6. Precomputes the dependency graph once per class: `_dependents_of` maps a
+       field to the fields that depend on it, and `_dependency_order` lists the
+       dependent fields in topological order (raises CircularDependencyError on cycles)
+    7. Stores `_dependencies_graph` (field name -> dependency tuple) for schema generation
     """
     
     def __new__(mcls, name, bases, attrs):
@@ -35,44 +47,92 @@ class DependencyFormMetaClass(DeclarativeFieldsMetaclass):
         cls = super().__new__(mcls, name, bases, attrs) 
 
         base_fields:Dict[str, Field] = cls.base_fields
-        cls._field_dependencies:Dict[str, Dict[str, Any]] = {}
-        field_names:List[str] = base_fields.keys()
+        cls._field_dependencies:Dict[str, FieldDependency] = {}
+        field_names:FrozenSet[str] = frozenset(base_fields)
 
         for field_name, field in base_fields.items():
-            if hasattr(field, "dependent_on") and field.dependent_on:
-
-                # Validate dependencies
-                for dep in field.dependent_on:
-                    if dep not in field_names:
-                        raise MissingDependencyError(
-                            f"{name}.{field_name} depends on '{dep}', "
-                            f"but no such field exists."
-                        )
-                    if dep == field_name:
-                        raise SelfReferenceError(
-                            f"{name}.{field_name} cannot depend on itself."
-                        )
-
-                # Resolve loader
-                loader = field.loader
-                if loader is None:
-                    loader_name = f"{field_name}_loader"
-                    loader = attrs.get(loader_name)
-
-                if loader is None:
-                    raise MissingLoaderError(
-                        f"{name}.{field_name} requires a loader. "
-                        f"Define '{field_name}_loader' or pass loader=."
-                    )
-
-                if not callable(loader):
-                    raise NonCallableLoaderError(
-                        f"{name}.{field_name} requires a loader. "
-                        f"The provided loader is not callable."
-                    )
-
-                cls._field_dependencies[field_name] = {
-                    "dependent_on": field.dependent_on,
-                    "loader": loader,
-                }
+            dependent_on = getattr(field, "dependent_on", None)
+            if not dependent_on:
+                continue
+
+            # Validate dependencies in a single set operation
+            missing = set(dependent_on) - field_names
+            if missing:
+                dep = next(d for d in dependent_on if d in missing)
+                raise MissingDependencyError(
+                    f"{name}.{field_name} depends on '{dep}', "
+                    f"but no such field exists."
+                )
+            if field_name in dependent_on:
+                raise SelfReferenceError(
+                    f"{name}.{field_name} cannot depend on itself."
+                )
+
+            # Resolve loader: explicit loader=, then {field_name}_loader on this class or a base
+            loader = field.loader
+            if loader is None:
+                loader_name = f"{field_name}_loader"
+                loader = attrs.get(loader_name) or getattr(cls, loader_name, None)
+
+            if loader is None:
+                raise MissingLoaderError(
+                    f"{name}.{field_name} requires a loader. "
+                    f"Define '{field_name}_loader' or pass loader=."
+                )
+
+            if not callable(loader):
+                raise NonCallableLoaderError(
+                    f"{name}.{field_name} requires a loader. "
+                    f"The provided loader is not callable."
+                )
+
+            cls._field_dependencies[field_name] = FieldDependency(tuple(dependent_on), loader)
+
+        cls._dependents_of, cls._dependency_order = mcls._build_dependency_graph(
+            name, cls._field_dependencies
+        )
+        # Static per-class part of the form schema (see DefaultFormSchemaBuilder)
+        cls._dependencies_graph:Dict[str, Tuple[str, ...]] = {
+            field_name: meta.dependent_on
+            for field_name, meta in cls._field_dependencies.items()
+        }
         return cls
+
+    @staticmethod
+    def _build_dependency_graph(
+        name: str, field_dependencies: Dict[str, FieldDependency]
+    ) -> Tuple[Dict[str, Tuple[str, ...]], Tuple[str, ...]]:
+        """
+        Invert the dependency map and sort the dependent fields (Kahn's algorithm).
+
+        Returns:
+            (dependents_of, dependency_order) where dependents_of maps a parent field
+            to the fields depending on it, and dependency_order lists every dependent
+            field after all of its parents.
+        """
+        dependents_of: Dict[str, List[str]] = {}
+        in_degree: Dict[str, int] = {}
+        for field_name, meta in field_dependencies.items():
+            in_degree[field_name] = 0
+            for dep in meta.dependent_on:
+                dependents_of.setdefault(dep, []).append(field_name)
+                if dep in field_dependencies:
+                    in_degree[field_name] += 1
+
+        queue = deque(f for f, degree in in_degree.items() if degree == 0)
+        order: List[str] = []
+        while queue:
+            field_name = queue.popleft()
+            order.append(field_name)
+            for child in dependents_of.get(field_name, ()):
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+
+        if len(order) != len(in_degree):
+            cyclic = [f for f, degree in in_degree.items() if degree > 0]
+            raise CircularDependencyError(
+                f"{name} has circular field dependencies involving: {', '.join(cyclic)}"
+            )
+
+        return {parent: tuple(children) for parent, children in dependents_of.items()}, tuple(order)
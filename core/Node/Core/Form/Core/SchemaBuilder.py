@@ -6,7 +6,6 @@ Following SOLID principles:
 - OCP: New schema formats can be added without modifying BaseForm
 - DIP: BaseForm depends on FormSchemaBuilder abstraction
 """
-import json
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -14,6 +13,26 @@ if TYPE_CHECKING:
     from .BaseForm import BaseForm
 
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+_MAX_JSON_DEPTH = 32
+
+
+def _is_json_safe(value, depth: int = 0) -> bool:
+    """Type-check that json.dumps would accept value, without serializing it."""
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if depth >= _MAX_JSON_DEPTH:
+        return False
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_safe(item, depth + 1) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, _JSON_SCALARS) and _is_json_safe(item, depth + 1)
+            for key, item in value.items()
+        )
+    return False
+
+
 class FormSchemaBuilder(ABC):
     """
     Abstract interface for building form schemas.
@@ -51,14 +70,19 @@ class DefaultFormSchemaBuilder(FormSchemaBuilder):
     def build(self, form: "BaseForm") -> dict:
         """Build complete form schema."""
         schema = self._build_base_structure(form)
+        errors = getattr(form, 'errors', None) or {}
+        field_values = form._field_values
+        # Show the pre-render (template) values when the node stored them
+        display_values = getattr(form, '_original_field_values', field_values)
+        append_field = schema["fields"].append
+        build_field_schema = self._build_field_schema
         
         # Build schema for each field
         for field_name, field in form.fields.items():
-            field_schema = self._build_field_schema(form, field_name, field)
-            schema["fields"].append(field_schema)
+            append_field(build_field_schema(form, field_name, field, errors, field_values, display_values))
         
         # Add form-level errors if any
-        schema["form_level_errors"] = self._extract_form_errors(form)
+        schema["form_level_errors"] = self._extract_form_errors(errors)
         
         return schema
     
@@ -67,58 +91,62 @@ class DefaultFormSchemaBuilder(FormSchemaBuilder):
         return {
             "form_name": form.__class__.__name__,
             "fields": [],
-            "field_order": list(form.fields.keys()),
-            "dependencies_graph": {
-                name: meta.get("dependent_on", [])
-                for name, meta in form._field_dependencies.items()
-            }
+            "field_order": list(form.fields),
+            "dependencies_graph": dict(form._dependencies_graph),
         }
     
-    def _build_field_schema(self, form: "BaseForm", field_name: str, field) -> dict:
+    def _build_field_schema(
+        self, form: "BaseForm", field_name: str, field, errors, field_values: dict, display_values: dict
+    ) -> dict:
         """Build complete schema for a single field."""
         field_schema = {}
+        dependencies, dependency_status, ready = self._compute_dependency_block(form, field_name, field_values)
         
         # Add basic metadata
-        field_schema.update(self._extract_field_metadata(form, field_name, field))
+        field_schema.update(
+            self._extract_field_metadata(field_name, field, ready, display_values.get(field_name))
+        )
         
         # Add dependency information
-        field_schema.update(self._extract_dependency_info(form, field_name))
+        field_schema.update(self._extract_dependency_info(dependencies, dependency_status, ready))
         
         # Add widget information
         field_schema["widget"] = self._extract_widget_info(field)
         
         # Add errors if any
-        field_schema["field_level_errors"] = self._extract_field_errors(form, field_name)
+        field_schema["field_level_errors"] = self._extract_field_errors(errors, field_name)
         
         return field_schema
     
-    def _is_field_ready(self, form: "BaseForm", field_name: str) -> bool:
-        """Check if all dependencies for a field are satisfied."""
-        dependencies = form._field_dependencies.get(field_name, {}).get("dependent_on", [])
-        return all(dep in form._field_values for dep in dependencies)
+    def _compute_dependency_block(self, form: "BaseForm", field_name: str, field_values: dict) -> tuple:
+        """
+        Resolve a field's dependencies once.
+        
+        Returns:
+            (dependencies, dependency_status, ready) where dependency_status maps each
+            dependency to whether it has a value and ready is True when all do.
+        """
+        dependencies = form._get_dependencies(field_name)
+        dependency_status = {
+            dep: dep in field_values
+            for dep in dependencies
+        }
+        return dependencies, dependency_status, all(dependency_status.values())
     
-    def _extract_field_metadata(self, form: "BaseForm", field_name: str, field) -> dict:
+    def _extract_field_metadata(self, field_name: str, field, is_ready: bool, value) -> dict:
         """Extract basic metadata for a field."""
-        is_ready = self._is_field_ready(form, field_name)
-        
+        initial = field.initial
         return {
             "name": field_name,
             "label": field.label or field_name.title(),
             "help_text": field.help_text or None,
             "disabled": getattr(field, 'disabled', False) or not is_ready,
-            "initial": field.initial if not callable(field.initial) else None,
-            "value": getattr(form, '_original_field_values', form._field_values).get(field_name),
+            "initial": initial if not callable(initial) else None,
+            "value": value,
         }
     
-    def _extract_dependency_info(self, form: "BaseForm", field_name: str) -> dict:
+    def _extract_dependency_info(self, dependencies, dependency_status: dict, ready: bool) -> dict:
         """Extract dependency information for a field."""
-        dependencies = form._field_dependencies.get(field_name, {}).get("dependent_on", [])
-        dependency_status = {
-            dep: dep in form._field_values 
-            for dep in dependencies
-        }
-        ready = self._is_field_ready(form, field_name)
-        
         return {
             "dependencies": dependencies,
             "dependency_status": dependency_status,
@@ -127,20 +155,11 @@ class DefaultFormSchemaBuilder(FormSchemaBuilder):
     
     def _extract_widget_info(self, field) -> dict:
         """Extract widget information for a field. Only includes JSON-serializable values."""
-        if hasattr(field.widget, 'input_type'):
-            input_type = field.widget.input_type
-        else:
-            input_type = None
-
-        out = {"input_type": input_type}
-        for key, value in field.widget.__dict__.items():
-            if callable(value):
-                continue
-            try:
-                json.dumps(value)
-            except (TypeError, ValueError):
-                continue
-            out[key] = value
+        widget = field.widget
+        out = {"input_type": getattr(widget, 'input_type', None)}
+        for key, value in widget.__dict__.items():
+            if not callable(value) and _is_json_safe(value):
+                out[key] = value
         # Ensure ChoiceField choices are in schema for frontend select
         if hasattr(field, 'choices') and field.choices:
             try:
@@ -149,17 +168,12 @@ class DefaultFormSchemaBuilder(FormSchemaBuilder):
                 pass
         return out
     
-    def _extract_field_errors(self, form: "BaseForm", field_name: str) -> list:
-        """Extract validation errors for a field if form is bound."""
-        if hasattr(form, 'errors') and field_name in form.errors:
-            error_list = form.errors[field_name]
-            return [str(error) for error in error_list]
-        return []
+    def _extract_field_errors(self, errors, field_name: str) -> list:
+        """Extract validation errors for a field from the form's errors mapping."""
+        error_list = errors.get(field_name)
+        return [str(error) for error in error_list] if error_list else []
     
-    def _extract_form_errors(self, form: "BaseForm") -> list:
+    def _extract_form_errors(self, errors) -> list:
         """Extract form-level validation errors if any."""
-        if hasattr(form, 'errors') and form.errors:
-            non_field_errors = form.errors.get('__all__', [])
-            if non_field_errors:
-                return [str(error) for error in non_field_errors]
-        return []
+        non_field_errors = errors.get('__all__')
+        return [str(error) for error in non_field_errors] if non_field_errors else []
@@ -10,4 +10,5 @@ from .exceptions import (
     SelfReferenceError,
     MissingLoaderError,
     NonCallableLoaderError,
+    CircularDependencyError,
 )
@@ -26,3 +26,8 @@ class MissingLoaderError(FormDependencyError):
 class NonCallableLoaderError(FormDependencyError):
     """Raised when the loader is not callable."""
     pass
+
+
+class CircularDependencyError(FormDependencyError):
+    """Raised when field dependencies form a cycle."""
+    pass
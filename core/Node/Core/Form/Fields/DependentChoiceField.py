@@ -7,7 +7,8 @@ class DependentChoiceField(forms.ChoiceField):
     
     The `dependent_on` and `loader` attributes are immutable after initialization.
     """
-    
+    __slots__ = ('_dependent_on', '_loader')
+
     def __init__(self, *args, dependent_on=None, loader=None, **kwargs):
         super().__init__(*args, **kwargs)
         # Store as tuple for immutability
@@ -16,8 +17,8 @@ class DependentChoiceField(forms.ChoiceField):
 
     @property
     def dependent_on(self):
-        """Read-only list of field names this field depends on."""
-        return list(self._dependent_on)
+        """Read-only tuple of field names this field depends on."""
+        return self._dependent_on
 
     @dependent_on.setter
     def dependent_on(self, value):
@@ -17,7 +17,8 @@ class JSONTextareaWidget(forms.Textarea):
     Single Responsibility: Mark textarea fields as JSON editors.
     
     This widget adds the 'data-json-mode' attribute to the rendered textarea,
-    which is extracted by FormSerializer and passed to the frontend as json_mode.
+    which DefaultFormSchemaBuilder reads from widget.attrs (no HTML rendering)
+    and passes to the frontend.
     """
     
     def __init__(self, attrs=None):
@@ -4,6 +4,8 @@ from .TemplateRenderer import TemplateRenderer
 
 
 class FormTemplateProcessor:
+    __slots__ = ('renderer', 'errors')
+
     def __init__(self, renderer: TemplateRenderer):
         self.renderer = renderer
         self.errors: Dict[str, str] = {}
@@ -27,18 +29,24 @@ class FormTemplateProcessor:
         Returns: dict of {field_name: error_message} for fields with errors
         """
         self.errors = {}  # Reset errors
-        processed_values = {}
+        support = self.renderer.support
+        values = form.get_unbound_field_values()
         
-        for field_name, value in form.get_unbound_field_values().items():
-            if isinstance(value, str) and self.renderer.support(value):
-                rendered_value, error = self.renderer.render(value, data)
+        # Nothing to render: leave the form untouched
+        if not any(isinstance(value, str) and support(value) for value in values.values()):
+            return self.errors
+        
+        render = self.renderer.render
+        processed_values = {}
+        for field_name, value in values.items():
+            if isinstance(value, str) and support(value):
+                rendered_value, error = render(value, data)
                 processed_values[field_name] = rendered_value
                 if error:
                     self.errors[field_name] = error
             else:
                 processed_values[field_name] = value
         
-        if processed_values:
-            form.update_fields(processed_values)
+        form.update_fields(processed_values)
         
         return self.errors
\ No newline at end of file
@@ -1,12 +1,50 @@
+import re
+from functools import lru_cache
 from jinja2 import Environment, StrictUndefined
 from jinja2.exceptions import TemplateSyntaxError
 from typing import Tuple, Optional
 from .TemplateRenderer import TemplateRenderer
 
+# Max distinct template sources kept compiled per renderer
+TEMPLATE_CACHE_SIZE = 1024
+
+# A template that is exactly one plain attribute chain on data, e.g. "{{ data.user.name }}"
+_DATA_PATH_PATTERN = re.compile(r'\{\{\s*data((?:\.[A-Za-z_][A-Za-z0-9_]*)+)\s*\}\}')
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _parse_data_path(template: str) -> Optional[Tuple[str, ...]]:
+    """Return the attribute names of a bare {{ data.a.b }} template, or None."""
+    match = _DATA_PATH_PATTERN.fullmatch(template)
+    if match is None:
+        return None
+    return tuple(match.group(1)[1:].split('.'))
+
+
+def _lookup_data_path(data, path: Tuple[str, ...]):
+    """
+    Resolve path through nested plain dicts the way Jinja would.
+    Returns _MISSING whenever Jinja's own lookup could differ (non-dict values,
+    keys shadowed by dict methods, missing keys) so the caller falls back to Jinja.
+    """
+    value = data
+    for name in path:
+        if type(value) is not dict or hasattr(dict, name):
+            return _MISSING
+        value = value.get(name, _MISSING)
+        if value is _MISSING:
+            return _MISSING
+    return value
+
+
 class jinja2TemplateRenderer(TemplateRenderer):
     def __init__(self):
         # Use StrictUndefined to raise errors for undefined variables
-        self.env = Environment(undefined=StrictUndefined)
+        self.env = Environment(undefined=StrictUndefined, auto_reload=False)
+        # Parse + compile each distinct template source once, then reuse the Template
+        self._compile = lru_cache(maxsize=TEMPLATE_CACHE_SIZE)(self.env.from_string)
 
     def support(self, template: str) -> bool:
         """Check if string looks like a Jinja2 template (contains delimiters)."""
@@ -22,8 +60,20 @@ class jinja2TemplateRenderer(TemplateRenderer):
         - Success: (rendered_string, None)
         - Failure: (original_template, error_message)
         """
+        if isinstance(template, str):
+            # Literal text (no tag can start without '{') renders as itself; Jinja only
+            # rewrites line endings and a trailing newline, so those still go through it
+            if "{" not in template and "\r" not in template and not template.endswith("\n"):
+                return template, None
+            # Bare {{ data.x.y }} lookups skip Jinja; anything unusual still renders below
+            path = _parse_data_path(template)
+            if path is not None:
+                value = _lookup_data_path(data, path)
+                if value is not _MISSING:
+                    return str(value), None
         try:
-            tpl = self.env.from_string(template)
+            # Only hashable str sources go through the compile cache
+            tpl = self._compile(template) if isinstance(template, str) else self.env.from_string(template)
             return tpl.render(data=data), None
         except Exception as e:
-            return template, str(e)
\ No newline at end of file
+            return template, str(e)
@@ -8,5 +8,6 @@ from .Core.exceptions import (
     SelfReferenceError,
     MissingLoaderError,
     NonCallableLoaderError,
+    CircularDependencyError,
 )
 from .Core.SchemaBuilder import FormSchemaBuilder, DefaultFormSchemaBuilder
\ No newline at end of file
@@ -10,11 +10,60 @@ form loaders that need to call async APIs but may be invoked during node executi
 """
 
 import asyncio
+import atexit
 import concurrent.futures
-from typing import TypeVar, Callable, Any
+import threading
+from typing import TypeVar, Callable, Any, Optional
 
 T = TypeVar('T')
 
+# Long-lived event loop on a daemon thread that serves every async-context call
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_running_loop_public() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+# Returns None outside a running loop instead of raising, which keeps the sync path cheap
+_get_running_loop = getattr(asyncio, "_get_running_loop", _get_running_loop_public)
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background loop, starting its thread on first use."""
+    global _background_loop
+    if _background_loop is None:
+        with _background_loop_lock:
+            if _background_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="async_safe_loop",
+                    daemon=True,
+                ).start()
+                _background_loop = loop
+    return _background_loop
+
+
+@atexit.register
+def _stop_background_loop() -> None:
+    if _background_loop is not None and _background_loop.is_running():
+        _background_loop.call_soon_threadsafe(_background_loop.stop)
+
+
+def _run_in_new_loop(async_func: Callable[..., T], args: Any, kwargs: Any, timeout: float) -> T:
+    """
+    Run on a throwaway thread and loop. Only used when called from the background
+    loop itself, where waiting on that same loop would deadlock.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(asyncio.run, async_func(*args, **kwargs))
+        return future.result(timeout=timeout)
+
 
 def run_async_safe(async_func: Callable[..., T], *args: Any, timeout: float = 30, **kwargs: Any) -> T:
     """
@@ -22,7 +71,12 @@ def run_async_safe(async_func: Callable[..., T], *args: Any, timeout: float = 30
     
     This function detects the current context and uses the appropriate method:
     - In sync context: Uses async_to_sync directly
-    - In async context: Runs in a separate thread with its own event loop
+    - In async context: Runs on a shared event loop in a background thread
+    
+    Every async-context caller shares that loop, so the coroutine must not make
+    blocking calls directly; push them into a worker with asyncio.to_thread.
+    A coroutine that blocks the loop stalls every later caller, and cancelling
+    it on timeout cannot interrupt the blocking call.
     
     This pattern is needed because async_to_sync fails when there's already
     a running event loop (e.g., during node execution).
@@ -49,26 +103,24 @@ def run_async_safe(async_func: Callable[..., T], *args: Any, timeout: float = 30
         from Node.Core.Form.utils import run_async_safe
         result = run_async_safe(populate_spreadsheet_choices, account_id)
     """
-    try:
-        # Check if we're in an async context
-        loop = asyncio.get_running_loop()
-        
-        # We're in an async context - can't use async_to_sync
-        # Run in a separate thread with its own event loop
-        def run_in_thread():
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                return new_loop.run_until_complete(async_func(*args, **kwargs))
-            finally:
-                new_loop.close()
-        
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_in_thread)
-            return future.result(timeout=timeout)
-            
-    except RuntimeError:
+    running_loop = _get_running_loop()
+    if running_loop is None:
         # No running event loop - we're in sync context
         # Safe to use async_to_sync
         from asgiref.sync import async_to_sync
         return async_to_sync(async_func)(*args, **kwargs)
+
+    # We're in an async context - can't use async_to_sync
+    # Hand the coroutine to the background loop and block until it finishes
+    background_loop = _get_background_loop()
+    if running_loop is background_loop:
+        return _run_in_new_loop(async_func, args, kwargs, timeout)
+
+    future = asyncio.run_coroutine_threadsafe(async_func(*args, **kwargs), background_loop)
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        # Cancellation lands at the coroutine's next await; work already handed
+        # to a worker thread runs to completion in the background
+        future.cancel()
+        raise
@@ -1,18 +1,24 @@
 from abc import ABC
+from functools import lru_cache
 import json
-import re
+import logging
 from typing import Any, Optional
 
 import structlog
+from django.core.exceptions import ValidationError
+from django.forms.utils import ErrorDict
+from jinja2 import Environment, Template, pass_context
 from .....log_safe import log_safe_output
 from .Data import NodeConfig, NodeOutput, ExecutionCompleted
 from .BaseNodeProperty import BaseNodeProperty
 from .BaseNodeMethod import BaseNodeMethod
 
 logger = structlog.get_logger(__name__)
+# stdlib logger behind the structlog wrapper; checked before building hot-path log kwargs
+_stdlib_logger = logging.getLogger(__name__)
 
-# Jinja template detection pattern
-JINJA_PATTERN = re.compile(r'\{\{.*?\}\}')
+# Upper bound on distinct field templates kept compiled across all nodes
+TEMPLATE_CACHE_SIZE = 1024
 
 
 class _JinjaDataWrapper:
@@ -72,9 +78,25 @@ class _JinjaDataWrapper:
 
 def contains_jinja_template(value) -> bool:
     """Check if a value contains Jinja template syntax."""
-    if value is None:
+    if isinstance(value, str):
+        text = value
+    elif value is None:
         return False
-    return bool(JINJA_PATTERN.search(str(value)))
+    else:
+        text = str(value)
+    # A "{{" followed by "}}" with no newline in between (str.find scans in C).
+    # If a newline separates an opening from the first closing after it, every
+    # opening before that newline fails too, so resume the search past it.
+    start = text.find('{{')
+    while start != -1:
+        end = text.find('}}', start + 2)
+        if end == -1:
+            return False
+        newline = text.find('\n', start + 2, end)
+        if newline == -1:
+            return True
+        start = text.find('{{', newline + 1)
+    return False
 
 
 def _unwrap_for_json(val: Any) -> Any:
@@ -119,26 +141,36 @@ class RuntimeMutable:
         return self._dict.get(key, default)
 
 
-def _make_set_runtime(runtime_dict: dict):
-    """Return a Jinja filter that sets runtime_dict[key] = val and returns the left-hand value."""
+@pass_context
+def _set_runtime_filter(context, value: Any, key: str, val: Any) -> Any:
+    """Jinja filter that sets runtime[key] = val and returns the left-hand value."""
+    runtime = context.get("runtime")
+    if isinstance(runtime, RuntimeMutable):
+        runtime._dict[key] = val
+    return value
 
-    def set_runtime(value: Any, key: str, val: Any) -> Any:
-        if isinstance(runtime_dict, dict):
-            runtime_dict[key] = val
-        return value
 
-    return set_runtime
+@pass_context
+def _delete_runtime_filter(context, value: Any, key: str) -> Any:
+    """Jinja filter that removes key from runtime and returns the left-hand value."""
+    runtime = context.get("runtime")
+    if isinstance(runtime, RuntimeMutable):
+        runtime._dict.pop(key, None)
+    return value
 
 
-def _make_delete_runtime(runtime_dict: dict):
-    """Return a Jinja filter that removes key from runtime_dict and returns the left-hand value."""
+# Shared environment for form field templates. The runtime filters read the
+# RuntimeMutable from the render context, so one environment serves every node.
+_JINJA_ENV = Environment()
+_JINJA_ENV.filters["tojson"] = _tojson_filter
+_JINJA_ENV.filters["set_runtime"] = _set_runtime_filter
+_JINJA_ENV.filters["delete_runtime"] = _delete_runtime_filter
 
-    def delete_runtime(value: Any, key: str) -> Any:
-        if isinstance(runtime_dict, dict):
-            runtime_dict.pop(key, None)
-        return value
 
-    return delete_runtime
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _get_template(source: str) -> Template:
+    """Compile a field template once and reuse it for every later render."""
+    return _JINJA_ENV.from_string(source)
 
 
 class FormValidationError(Exception):
@@ -158,21 +190,89 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
     This class is used to define the base node class and is not meant to be instantiated directly.
     use for type hinting and inheritance.
     """
+
+    __slots__ = (
+        "node_config",
+        "form",
+        "execution_count",
+        "_validation_completed",
+        "_log_identifier",
+        "_template_source",
+        "_templated_field_names",
+        "_static_fields",
+        "_compiled_templates",
+        "_suffixed_output_keys",
+    )
+
+    # Emit the per-run "Form values populated" log only every N runs (1 = every run)
+    LOG_EVERY_N = 1
     
     def __init__(self, node_config: NodeConfig):
         self.node_config = node_config
+        self._log_identifier = f"{self.__class__.__name__}({self.identifier()})"
+        self._template_source = None  # Form config dict the field index below was built from
+        self._templated_field_names = frozenset()
+        self._static_fields = {}
+        self._compiled_templates = None  # Compiled on first render, not at validation time
+        self._suffixed_output_keys = {}  # base_key -> ["<base_key>_2", "<base_key>_3", ...]
         self.form = self.get_form()
         self._populate_form()
         self.execution_count = 0
         self._validation_completed = False  # Track if NodeValidator already validated this node
     
+    def __getstate__(self):
+        # Same (dict, slots) shape pickle uses by default for slotted objects.
+        # Compiled Jinja templates can't be pickled (PROCESS pool); they are rebuilt on first render
+        slot_state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    slot_state[name] = getattr(self, name)
+        slot_state["_compiled_templates"] = None
+        return getattr(self, "__dict__", None), slot_state
+
     def _populate_form(self):
         """
         Populate the form with the data from the config.
         """
         if self.form is not None and self.node_config.data.form:
             self.form.update_fields(self.node_config.data.form)
-            # logger.info(f"Form Populated", form=self.form.get_unbound_field_values(), node_id=self.node_config.id, identifier=f"{self.__class__.__name__}({self.identifier()})")
+            # logger.info(f"Form Populated", form=self.form.get_unbound_field_values(), node_id=self.node_config.id, identifier=self._log_identifier)
+
+    def _index_form_config(self) -> None:
+        """
+        Split the configured form values into templated field names and static values.
+        Runs once per form config; it is only repeated when node_config.data.form
+        is replaced (e.g. a node reused across test executions).
+        """
+        form_data = self.node_config.data.form
+        if form_data is self._template_source:
+            return
+        templated_field_names = set()
+        static_fields = {}
+        for field_name in self.form.fields:
+            raw_value = (form_data or {}).get(field_name)
+            if raw_value is None:
+                continue
+            if contains_jinja_template(raw_value):
+                templated_field_names.add(field_name)
+            else:
+                static_fields[field_name] = raw_value
+        self._templated_field_names = frozenset(templated_field_names)
+        self._static_fields = static_fields
+        self._compiled_templates = None
+        self._template_source = form_data
+
+    @property
+    def has_jinja_templates(self) -> bool:
+        """
+        Whether any configured form value is a Jinja template.
+        Cached per form config by _index_form_config.
+        """
+        if self.form is None:
+            return False
+        self._index_form_config()
+        return bool(self._templated_field_names)
 
     def is_ready(self) -> bool:
         """
@@ -216,10 +316,11 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
         if self.form is None:
             return True
         
-        # Clear any existing errors
-        self.form._errors = None
-        
         form_data = self.node_config.data.form or {}
+        self._index_form_config()
+        templated_field_names = self._templated_field_names
+        errors = ErrorDict()
+        error_class = self.form.error_class
         
         for field_name, field in self.form.fields.items():
             value = form_data.get(field_name)
@@ -227,33 +328,28 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
             # For Jinja templates, DependentChoiceField, or fields that use sync ORM in clean():
             # only check required + not empty (full clean would run from async context and fail).
             if (
-                contains_jinja_template(value)
+                field_name in templated_field_names
                 or isinstance(field, DependentChoiceField)
                 or hasattr(field, '_dependent_on')
                 or getattr(field, '_skip_clean_in_async', False)
             ):
                 if field.required and (value is None or str(value).strip() == ''):
-                    if self.form._errors is None:
-                        from django.forms.utils import ErrorDict
-                        self.form._errors = ErrorDict()
-                    self.form._errors[field_name] = self.form.error_class(['This field is required.'])
+                    errors[field_name] = error_class(['This field is required.'])
             else:
                 # For regular fields: perform normal field validation
                 try:
                     field.clean(value)
                 except Exception as e:
-                    if self.form._errors is None:
-                        from django.forms.utils import ErrorDict
-                        self.form._errors = ErrorDict()
                     # Extract clean error message from ValidationError
-                    from django.core.exceptions import ValidationError
                     if isinstance(e, ValidationError) and hasattr(e, 'messages'):
                         error_msg = e.messages[0] if e.messages else str(e)
                     else:
                         error_msg = str(e)
-                    self.form._errors[field_name] = self.form.error_class([error_msg])
+                    errors[field_name] = error_class([error_msg])
         
-        return not bool(self.form._errors)
+        # Replace any previous errors; None (not an empty ErrorDict) when valid
+        self.form._errors = errors or None
+        return not errors
     
     def _extract_clean_error_messages(self, form) -> str:
         """
@@ -302,8 +398,6 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
         Raises:
             FormValidationError: If form validation fails after rendering.
         """
-        from jinja2 import Environment, Template
-        
         if self.form is None:
             return
         
@@ -312,7 +406,9 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
         # Store original values before rendering (for schema generation on validation errors)
         self.form._original_field_values = form_data.copy()
         
-        rendered_values = {}
+        has_jinja_templates = self.has_jinja_templates
+        static_fields = self._static_fields
+
         meta = node_data.metadata or {}
         if not isinstance(meta, dict):
             meta = {}
@@ -323,28 +419,35 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
             if isinstance(node_data.metadata, dict):
                 node_data.metadata["runtime"] = runtime_dict
 
-        # First, initialize ALL form fields with their values from form_data
-        # This ensures fields without Jinja templates are also populated
-        for field_name in self.form.fields:
-            if field_name in form_data:
-                raw_value = form_data.get(field_name)
-                if raw_value is not None:
-                    # Update field with the value (will be rendered if it contains Jinja)
-                    if contains_jinja_template(str(raw_value)):
-                        # Render with wrapper so data.forEachNode etc. work (dict keys as attributes).
-                        # Custom tojson filter unwraps _JinjaDataWrapper so {{ data.forEachNode|tojson }} works.
-                        env = Environment()
-                        env.filters["tojson"] = _tojson_filter
-                        env.filters["set_runtime"] = _make_set_runtime(runtime_dict)
-                        env.filters["delete_runtime"] = _make_delete_runtime(runtime_dict)
-                        template = env.from_string(str(raw_value))
-                        data_for_jinja = _JinjaDataWrapper(node_data.data)
-                        rendered_value = template.render(
-                            data=data_for_jinja,
-                            workflowenv=workflow_env,
-                            runtime=RuntimeMutable(runtime_dict),
-                        )
-                        rendered_values[field_name] = rendered_value
+        if not has_jinja_templates:
+            # Purely static form: the config values are the rendered values on every run
+            rendered_values = static_fields
+        else:
+            compiled_templates = self._compiled_templates
+            if compiled_templates is None:
+                compiled_templates = self._compiled_templates = {
+                    field_name: _get_template(str(form_data[field_name]))
+                    for field_name in self._templated_field_names
+                }
+            rendered_values = {}
+            debug_enabled = _stdlib_logger.isEnabledFor(logging.DEBUG)
+            # One set of render variables shared by every field template in this run.
+            # Render with wrapper so data.forEachNode etc. work (dict keys as attributes).
+            # Custom tojson filter unwraps _JinjaDataWrapper so {{ data.forEachNode|tojson }} works.
+            render_vars = {
+                "data": _JinjaDataWrapper(node_data.data),
+                "workflowenv": workflow_env,
+                "runtime": RuntimeMutable(runtime_dict),
+            }
+            # First, initialize ALL form fields with their values from form_data
+            # This ensures fields without Jinja templates are also populated
+            for field_name in self.form.fields:
+                template = compiled_templates.get(field_name)
+                if template is not None:
+                    raw_value = form_data[field_name]
+                    rendered_value = template.render(render_vars)
+                    rendered_values[field_name] = rendered_value
+                    if debug_enabled:
                         logger.debug(
                             "Rendered template field",
                             field=field_name,
@@ -352,9 +455,11 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
                             rendered=log_safe_output(rendered_value),
                             node_id=self.node_config.id
                         )
-                    else:
-                        # No Jinja template, just set the value directly
-                        rendered_values[field_name] = raw_value
+                elif field_name in static_fields:
+                    # No Jinja template, just set the value directly
+                    raw_value = static_fields[field_name]
+                    rendered_values[field_name] = raw_value
+                    if debug_enabled:
                         logger.debug(
                             "Set non-template field",
                             field=field_name,
@@ -383,7 +488,6 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
                 coerced_values[field_name] = field.to_python(value)
             except Exception as e:
                 # Extract clean error message from ValidationError
-                from django.core.exceptions import ValidationError
                 if isinstance(e, ValidationError) and hasattr(e, 'messages'):
                     error_msg = e.messages[0] if e.messages else str(e)
                 else:
@@ -394,7 +498,6 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
         # Raise clear error if type coercion fails
         if coercion_errors:
             # Set field-level errors on the form so they appear below each field
-            from django.forms.utils import ErrorDict
             if self.form._errors is None:
                 self.form._errors = ErrorDict()
             for field_name, error_msg in coercion_errors.items():
@@ -407,15 +510,16 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
                 f"Invalid field values: {'; '.join(error_messages)}"
             )
         
-        self.form._field_values = coerced_values.copy()
+        self.form._field_values = coerced_values
         self.form.cleaned_data = coerced_values.copy()
         
-        logger.info(
-            "Form values populated",
-            form=log_safe_output(self.form.get_unbound_field_values()),
-            node_id=self.node_config.id,
-            identifier=f"{self.__class__.__name__}({self.identifier()})",
-        )
+        if self.execution_count % self.LOG_EVERY_N == 0 and _stdlib_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Form values populated",
+                form=log_safe_output(self.form.get_unbound_field_values()),
+                node_id=self.node_config.id,
+                identifier=self._log_identifier,
+            )
             
     async def run(self, node_data: NodeOutput) -> NodeOutput:
         """
@@ -429,9 +533,10 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
             NodeOutput: The result of node execution.
         """
 
-        if isinstance(node_data, ExecutionCompleted):
+        # Exact type check: ExecutionCompleted has no subclasses, and this runs every iteration
+        if type(node_data) is ExecutionCompleted:
             await self.cleanup(node_data)
-            logger.warning("Cleanup completed", node_id=self.node_config.id, identifier=f"{self.__class__.__name__}({self.identifier()})")
+            logger.warning("Cleanup completed", node_id=self.node_config.id, identifier=self._log_identifier)
             return node_data
 
         self.populate_form_values(node_data)
@@ -472,14 +577,23 @@ class BaseNode(BaseNodeProperty, BaseNodeMethod, ABC):
         Returns:
             Unique key string (e.g., "google_sheets", "google_sheets_2", etc.)
         """
-        if base_key not in node_data.data:
+        data = node_data.data
+        if base_key not in data:
             return base_key
         
-        counter = 2
-        while f"{base_key}_{counter}" in node_data.data:
-            counter += 1
+        # Suffixed candidates are formatted once per node and reused on later runs
+        suffixed_keys = self._suffixed_output_keys.setdefault(base_key, [])
+        for key in suffixed_keys:
+            if key not in data:
+                return key
         
-        return f"{base_key}_{counter}"
+        counter = len(suffixed_keys) + 2
+        while True:
+            key = f"{base_key}_{counter}"
+            suffixed_keys.append(key)
+            if key not in data:
+                return key
+            counter += 1
 
 
 class NonBlockingNode(BaseNode, ABC):
@@ -488,7 +602,8 @@ class NonBlockingNode(BaseNode, ABC):
     Performs a computation or transformation but does not force the Producer 
     to wait for downstream operations.
     """
-    pass
+
+    __slots__ = ()
 
 
 class ProducerNode(BaseNode, ABC):
@@ -496,6 +611,8 @@ class ProducerNode(BaseNode, ABC):
     Marks loop start. Called first each iteration.
     Starts and controls the loop. Controls timing and triggers downstream nodes.
     """
+
+    __slots__ = ()
     
     @property
     def input_ports(self) -> list:
@@ -509,13 +626,17 @@ class BlockingNode(BaseNode, ABC):
     The LoopManager awaits the Blocking node and all downstream Blocking children 
     in its async chain to complete before proceeding.
     """
-    pass
+
+    __slots__ = ()
 
 class ConditionalNode(BlockingNode, ABC):
     """
     Base class for logical/conditional nodes that perform decision-making operations.
     Inherits from BlockingNode, ensuring logical operations complete before continuation.
     """
+
+    __slots__ = ("output", "test_result")
+
     def __init__(self, config: NodeConfig):
         super().__init__(config)
         self.output: Optional[str] = None
@@ -539,6 +660,9 @@ class LoopNode(BlockingNode, ABC):
     Base class for loop nodes that iterate over an array and run a subDAG per element.
     Inherits from BlockingNode; execution is done by the runner (iterations + subDAG).
     """
+
+    __slots__ = ()
+
     @property
     def output_ports(self) -> list:
         """Loop nodes have 'default' (outgoing) and 'subdag' (body entry) output branches."""
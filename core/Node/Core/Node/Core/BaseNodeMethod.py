@@ -8,6 +8,8 @@ from .Data import NodeOutput
 
 
 class BaseNodeMethod(ABC):
+
+    __slots__ = ()
     
     async def setup(self):
         """
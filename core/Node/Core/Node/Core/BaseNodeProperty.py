@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List
+from functools import cached_property
+from typing import Dict, Sequence
 
 from .Data import PoolType
 
+# Shared defaults; tuples so no node can grow or shrink them for every other node
+_DEFAULT_INPUT_PORTS = ({"id": "default", "label": "In"},)
+_DEFAULT_OUTPUT_PORTS = ({"id": "default", "label": "Out"},)
+_DEFAULT_WORKFLOW_TYPES = ('production', 'api')
+
 
 class BaseNodeProperty(ABC):
     """
@@ -11,8 +17,12 @@ class BaseNodeProperty(ABC):
     This class defines the interface for node identification and display
     properties. Subclasses must implement execution_pool and identifier.
     Other properties have default implementations for backward compatibility.
+    The defaults are cached per instance; subclasses overriding them with
+    constant values can use cached_property as well.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def execution_pool(self) -> PoolType:
@@ -30,7 +40,7 @@ class BaseNodeProperty(ABC):
         """
         pass
 
-    @property
+    @cached_property
     def label(self) -> str:
         """
         Get the display label for this node.
@@ -41,7 +51,7 @@ class BaseNodeProperty(ABC):
         """
         return self.__class__.__name__
 
-    @property
+    @cached_property
     def description(self) -> str:
         """
         Get the description for this node.
@@ -52,7 +62,7 @@ class BaseNodeProperty(ABC):
         """
         return ""
 
-    @property
+    @cached_property
     def icon(self) -> str:
         """
         Get the icon identifier for this node.
@@ -63,30 +73,30 @@ class BaseNodeProperty(ABC):
         """
         return ""
 
-    @property
-    def input_ports(self) -> list:
+    @cached_property
+    def input_ports(self) -> Sequence[Dict[str, str]]:
         """
         Define input ports for this node.
         Default is one 'default' input port.
         
         Returns:
-            list: List of port definitions [{"id": "default", "label": "In"}]
+            Sequence: Port definitions ({"id": "default", "label": "In"},)
         """
-        return [{"id": "default", "label": "In"}]
+        return _DEFAULT_INPUT_PORTS
 
-    @property
-    def output_ports(self) -> list:
+    @cached_property
+    def output_ports(self) -> Sequence[Dict[str, str]]:
         """
         Define output ports for this node.
         Default is one 'default' output port.
         
         Returns:
-            list: List of port definitions [{"id": "default", "label": "Out"}]
+            Sequence: Port definitions ({"id": "default", "label": "Out"},)
         """
-        return [{"id": "default", "label": "Out"}]
+        return _DEFAULT_OUTPUT_PORTS
 
-    @property
-    def supported_workflow_types(self) -> List[str]:
+    @cached_property
+    def supported_workflow_types(self) -> Sequence[str]:
         """
         Get the list of workflow types this node supports.
         
@@ -98,7 +108,7 @@ class BaseNodeProperty(ABC):
         - 'api': Request-response workflows triggered via API calls
         
         Returns:
-            List[str]: List of supported workflow type identifiers.
+            Sequence[str]: Supported workflow type identifiers.
                        Empty list or None means all types are supported.
         
         Example:
@@ -108,4 +118,4 @@ class BaseNodeProperty(ABC):
                 return ['production']
         """
         # Default: support all workflow types for backward compatibility
-        return ['production', 'api']
\ No newline at end of file
+        return _DEFAULT_WORKFLOW_TYPES
\ No newline at end of file
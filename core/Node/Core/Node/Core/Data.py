@@ -1,8 +1,39 @@
-from typing import Any, Dict, List, Optional, Union
-from uuid import uuid4
+import os
+import threading
+from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 from enum import Enum
 
+# Random bytes are read from os.urandom in batches and handed out 16 at a time
+_ID_BUFFER_SIZE = 4096
+_id_buffer = bytearray()
+_id_lock = threading.Lock()
+
+
+def _new_id() -> str:
+    """
+    Return a random version-4 UUID string, same format as str(uuid4()),
+    without building a uuid.UUID object or reading urandom per call.
+    """
+    with _id_lock:
+        if not _id_buffer:
+            _id_buffer.extend(os.urandom(_ID_BUFFER_SIZE))
+        raw = _id_buffer[-16:]
+        del _id_buffer[-16:]
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# A forked child (process pool) must not hand out the parent's buffered bytes
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_id_buffer.clear)
+
+
+def _execution_completed_metadata() -> Dict[str, Any]:
+    return {"__execution_completed__": True}
+
 
 class PoolType(Enum):
     ASYNC = "ASYNC"
@@ -32,31 +63,18 @@ class NodeConfig(BaseModel):
     )
 
 
-class NodeOutputMetaData(BaseModel):
-    """
-    Metadata for the node output.
-    """
-
-    sourceNodeID: Optional[str] = Field(
-        ..., description="ID of the node that produced the output"
-    )
-    destinationNodeIDs: Optional[List[str]] = Field(
-        ..., description="IDs of the nodes that will receive the output"
-    )
-
-
 class NodeOutput(BaseModel):
     """
     Runtime payload for the iteration.
     """
 
     id: str = Field(
-        default_factory=lambda: str(uuid4()),
+        default_factory=_new_id,
         description="Unique identifier for this unit of work",
     )
     data: Dict[str, Any] = Field(default_factory=dict, description="Main data payload")
 
-    metadata: Optional[Union[NodeOutputMetaData, Dict[str, Any]]] = Field(
+    metadata: Optional[Dict[str, Any]] = Field(
         default_factory=dict, description="Optional metadata"
     )
 
@@ -69,8 +87,8 @@ class ExecutionCompleted(NodeOutput):
     Sentinel signal indicating that the workflow execution should stop/cleanup.
     Unlike normal NodeOutput, this payload triggers cleanup() instead of execute().
     """
-    metadata: Optional[Union[NodeOutputMetaData, Dict[str, Any]]] = Field(
-        default_factory=lambda: {"__execution_completed__": True}
+    metadata: Optional[Dict[str, Any]] = Field(
+        default_factory=_execution_completed_metadata
     )
 
 
@@ -8,7 +8,7 @@ from django.forms import BooleanField, CharField, ChoiceField
 from django.forms.widgets import Textarea
 
 from ....Core.Form import BaseForm
-from .._shared.form_utils import BrowserSessionField
+from .._shared.form_utils import BrowserSessionField, MaxConcurrentPagesField
 
 
 class NetworkInterceptorForm(BaseForm):
@@ -18,7 +18,7 @@ class NetworkInterceptorForm(BaseForm):
         help_text=(
             "URLs to load (one per line, or leave empty to use 'urls' from input data). "
             "You can also use Jinja templates like {{ data.urls }}. "
-            "All URLs will be loaded in parallel."
+            "URLs are loaded in parallel, up to 'Max concurrent pages' at a time."
         )
     )
     
@@ -43,6 +43,16 @@ class NetworkInterceptorForm(BaseForm):
         help_text="Types of network requests to capture. Use 'xhr,fetch' for API calls."
     )
     
+    block_static_resources = BooleanField(
+        required=False,
+        initial=False,
+        label="Block static resources",
+        help_text=(
+            "Abort image, font, media and stylesheet requests while waiting for the matching response. "
+            "Only applies when capturing XHR/Fetch. Note: this disables the browser's HTTP cache for the page."
+        )
+    )
+
     url_pattern = CharField(
         required=False,
         help_text=(
@@ -89,3 +99,17 @@ class NetworkInterceptorForm(BaseForm):
         required=False,
         help_text="Maximum time to wait for a matching response in milliseconds. Default: 30000ms (30 seconds). Set to 0 for no timeout. Navigation uses 'commit'; no page content is returned."
     )
+
+    max_concurrent_pages = MaxConcurrentPagesField()
+
+    match_count = CharField(
+        initial='1',
+        required=False,
+        help_text="Number of matching responses to capture per URL before returning. Default: 1. Response bodies are fetched concurrently."
+    )
+
+    cache_ttl_seconds = CharField(
+        initial='0',
+        required=False,
+        help_text="Reuse a successful capture for the same URL and settings for this many seconds instead of loading the page again. The cache is kept in memory and holds at most 256 captures and 32 MB in total; captures larger than 4 MB are not cached. Default: 0 (disabled)."
+    )
@@ -5,13 +5,18 @@ Single Responsibility: Capture network requests and responses from JS-heavy webs
 """
 
 import json
+import logging
 from typing import Optional, List, Dict, Any
 import asyncio
+import orjson
 import structlog
 import re
 import json
 import time
 import ast
+import copy
+import threading
+from collections import OrderedDict
 from rich import print
 
 from playwright.async_api import Page, Request, Response
@@ -23,12 +28,97 @@ from apps.browsersession.services.domain_throttle_service import wait_before_req
 from ....Core.Form import BaseForm
 from .form import NetworkInterceptorForm
 from .._shared.BrowserManager import BrowserManager
+from .._shared.form_utils import parse_max_concurrent_pages
 from .._shared.services.session_resolver import extract_domain_from_url
 
 logger = structlog.get_logger(__name__)
+_stdlib_logger = logging.getLogger(__name__)
+
+_JSON_CONTENT_TYPE = re.compile(r'application/json', re.IGNORECASE)
+_SIZE_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)\s*(KB|MB|GB|TB)$')
+# First characters of a urls value that may be a Python literal (list, tuple, set, str)
+_LITERAL_PREFIXES = ('[', '(', '{', '"', "'")
+
+# Resource types that never carry a capturable API response; aborted when
+# block_static_resources is on and only other types (e.g. xhr/fetch) are captured
+_STATIC_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+# Extension glob for the static route, so document/script/xhr/fetch requests are
+# never paused for a Python round trip
+_STATIC_RESOURCE_GLOB = "**/*.{png,jpg,jpeg,gif,webp,svg,ico,woff,woff2,ttf,otf,css,mp4,webm,mp3}"
+
+# Process-wide cache of successful per-URL results, used when cache_ttl_seconds > 0.
+# Maps cache key -> (monotonic store time, result); oldest entries evicted first.
+_RESPONSE_CACHE_MAX_ENTRIES = 256
+# Entries hold captured bodies, so bound the cache by size as well as by count
+_RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_RESPONSE_CACHE_MAX_ENTRY_BYTES = 4 * 1024 * 1024
+_response_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_response_cache_bytes = 0
+_response_cache_lock = threading.Lock()
+
+
+def _get_cached_result(key: tuple, ttl_seconds: int) -> Optional[dict]:
+    """Return a copy of a cached result younger than ttl_seconds, or None."""
+    global _response_cache_bytes
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, size, result = entry
+        if time.monotonic() - stored_at > ttl_seconds:
+            del _response_cache[key]
+            _response_cache_bytes -= size
+            return None
+        _response_cache.move_to_end(key)
+    # Downstream nodes may mutate their input, so never hand out the cached object
+    return copy.deepcopy(result)
+
+
+def _store_cached_result(key: tuple, result: dict) -> None:
+    """
+    Cache a copy of a successful result, evicting the oldest entries once the
+    entry or byte budget is exceeded. Results larger than
+    _RESPONSE_CACHE_MAX_ENTRY_BYTES are not cached.
+    """
+    global _response_cache_bytes
+    # Serialized size is a close enough stand-in for the memory the copy will hold
+    size = len(orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS))
+    if size > _RESPONSE_CACHE_MAX_ENTRY_BYTES:
+        return
+    entry = (time.monotonic(), size, copy.deepcopy(result))
+    with _response_cache_lock:
+        previous = _response_cache.pop(key, None)
+        if previous is not None:
+            _response_cache_bytes -= previous[1]
+        _response_cache[key] = entry
+        _response_cache_bytes += size
+        while len(_response_cache) > _RESPONSE_CACHE_MAX_ENTRIES or _response_cache_bytes > _RESPONSE_CACHE_MAX_BYTES:
+            _, (_, evicted_size, _) = _response_cache.popitem(last=False)
+            _response_cache_bytes -= evicted_size
+
+
+# 1024-based unit multipliers for max_response_size
+_SIZE_MULTIPLIERS = {
+    'KB': 1024,
+    'MB': 1024 * 1024,
+    'GB': 1024 * 1024 * 1024,
+    'TB': 1024 * 1024 * 1024 * 1024,
+}
 
 
 class NetworkInterceptor(BlockingNode):
+    # Filters parsed once per execution (None = no filtering).
+    _url_re = None
+    _resource_types = None
+    _http_methods = None
+    _status_codes = None
+    _max_response_bytes = None
+    _return_timeout_ms = 30000
+    _match_count = 1
+    _include_body = True
+    _block_static = False
+    _debug_enabled = False
+
     @classmethod
     def identifier(cls) -> str:
         return "playwright-network-interceptor"
@@ -60,10 +150,23 @@ class NetworkInterceptor(BlockingNode):
         urls_value = self.form.cleaned_data.get("urls")
         urls = []
 
-        try:
-            urls_value = ast.literal_eval(urls_value)
-        except (ValueError, SyntaxError):
-            pass
+        # Only a rendered list/tuple/quoted literal needs literal_eval; plain
+        # newline-separated URLs would just fail to parse.
+        if isinstance(urls_value, str) and urls_value.lstrip(' \t')[:1] in _LITERAL_PREFIXES:
+            parsed = False
+            # A JSON array (e.g. rendered with |tojson) parses much faster as JSON;
+            # Python reprs use single quotes, so don't try JSON without a double quote.
+            if urls_value.lstrip(' \t')[:1] == '[' and '"' in urls_value:
+                try:
+                    urls_value = orjson.loads(urls_value)
+                    parsed = True
+                except orjson.JSONDecodeError:
+                    pass
+            if not parsed:
+                try:
+                    urls_value = ast.literal_eval(urls_value)
+                except (ValueError, SyntaxError):
+                    pass
 
         if urls_value:
             # Handle form field value (may be string or list after Jinja rendering)
@@ -104,7 +207,7 @@ class NetworkInterceptor(BlockingNode):
         size_str = size_str.strip().upper()
         
         # Match pattern: number followed by unit (KB, MB, GB)
-        match = re.match(r'^(\d+(?:\.\d+)?)\s*(KB|MB|GB|TB)$', size_str)
+        match = _SIZE_PATTERN.match(size_str)
         if not match:
             logger.warning("Invalid size format", size_str=size_str, node_id=self.node_config.id)
             return None
@@ -112,15 +215,123 @@ class NetworkInterceptor(BlockingNode):
         value = float(match.group(1))
         unit = match.group(2)
         
-        # Convert to bytes (1024-based)
-        multipliers = {
-            'KB': 1024,
-            'MB': 1024 * 1024,
-            'GB': 1024 * 1024 * 1024,
-            'TB': 1024 * 1024 * 1024 * 1024,
-        }
+        return int(value * _SIZE_MULTIPLIERS[unit])
+
+    def _parse_return_timeout(self) -> int:
+        """
+        Parse the return_timeout field into milliseconds.
+        
+        Returns:
+            Timeout in milliseconds (30000 if the value is invalid)
+        """
+        return_timeout_str = self.form.cleaned_data.get('return_timeout', '30000')
+        try:
+            return int(return_timeout_str)
+        except (ValueError, TypeError):
+            return 30000  # Default to 30 seconds
+
+    def _compile_url_pattern(self):
+        """
+        Compile the url_pattern filter once for the current execution.
+        
+        Returns:
+            Compiled pattern, or None if no pattern is set or it is invalid
+        """
+        url_pattern = self.form.cleaned_data.get('url_pattern', '').strip()
+        if not url_pattern:
+            return None
+        try:
+            return re.compile(url_pattern)
+        except re.error as e:
+            logger.warning(
+                "Invalid regex pattern",
+                pattern=url_pattern,
+                error=str(e),
+                node_id=self.node_config.id
+            )
+            # If regex is invalid, don't filter (capture all)
+            return None
+
+    def _parse_choice_filter(self, field_name: str, default: str) -> Optional[frozenset]:
+        """
+        Parse a comma-separated choice filter (e.g. 'xhr,fetch') into a set.
+        
+        Args:
+            field_name: Form field holding the filter
+            default: Value used when the field is missing
+            
+        Returns:
+            Frozenset of allowed values, or None for 'all'
+        """
+        value = self.form.cleaned_data.get(field_name, default)
+        if value == 'all':
+            return None
+        return frozenset(v.strip() for v in value.split(','))
+
+    def _parse_status_codes(self) -> Optional[frozenset]:
+        """
+        Parse the status_codes filter (e.g. '200,201,404') into a set of ints.
+        
+        Returns:
+            Frozenset of allowed status codes, or None if empty or invalid
+        """
+        status_codes = self.form.cleaned_data.get('status_codes', '').strip()
+        if not status_codes:
+            return None
+        try:
+            return frozenset(int(c.strip()) for c in status_codes.split(',') if c.strip())
+        except ValueError:
+            logger.warning(
+                "Invalid status code format",
+                status_codes=status_codes,
+                node_id=self.node_config.id
+            )
+            # If format is invalid, don't filter (capture all)
+            return None
+
+    def _parse_match_count(self) -> int:
+        """
+        Parse the match_count field.
         
-        return int(value * multipliers[unit])
+        Returns:
+            Number of matching responses to wait for per URL (at least 1)
+        """
+        try:
+            return max(int(self.form.cleaned_data.get('match_count') or 1), 1)
+        except (ValueError, TypeError):
+            return 1
+
+    def _parse_cache_ttl(self) -> int:
+        """
+        Parse the cache_ttl_seconds field.
+        
+        Returns:
+            TTL in seconds; 0 (caching disabled) if empty or invalid
+        """
+        try:
+            return max(int(self.form.cleaned_data.get('cache_ttl_seconds') or 0), 0)
+        except (ValueError, TypeError):
+            return 0
+
+    def _cache_key_prefix(self, session_name: str) -> tuple:
+        """
+        Build the part of the response cache key shared by all URLs of this execution.
+        
+        Includes the session and every field that affects which response is
+        captured and how, so differently configured nodes never share entries.
+        """
+        cleaned_data = self.form.cleaned_data
+        return (
+            self.identifier(),
+            session_name,
+            cleaned_data.get('capture_resource_types'),
+            cleaned_data.get('url_pattern'),
+            cleaned_data.get('http_methods'),
+            cleaned_data.get('status_codes'),
+            cleaned_data.get('include_response_body'),
+            cleaned_data.get('max_response_size'),
+            self._match_count,
+        )
 
     def _should_capture_request(self, request: Request) -> bool:
         """
@@ -133,10 +344,9 @@ class NetworkInterceptor(BlockingNode):
             True if request should be captured, False otherwise
         """
         # Get resource type filter
-        resource_types = self.form.cleaned_data.get('capture_resource_types', 'xhr,fetch')
-        if resource_types != 'all':
-            allowed_types = [t.strip() for t in resource_types.split(',')]
-            if request.resource_type not in allowed_types:
+        allowed_types = self._resource_types
+        if allowed_types is not None and request.resource_type not in allowed_types:
+            if self._debug_enabled:
                 logger.debug(
                     "Request filtered by resource type",
                     url=request.url,
@@ -144,34 +354,12 @@ class NetworkInterceptor(BlockingNode):
                     allowed=allowed_types,
                     node_id=self.node_config.id
                 )
-                return False
-        
-        # Get URL pattern filter
-        url_pattern = self.form.cleaned_data.get('url_pattern', '').strip()
-        if url_pattern:
-            try:
-                if not re.search(url_pattern, request.url):
-                    logger.debug(
-                        "Request filtered by URL pattern",
-                        url=request.url,
-                        pattern=url_pattern,
-                        node_id=self.node_config.id
-                    )
-                    return False
-            except re.error as e:
-                logger.warning(
-                    "Invalid regex pattern",
-                    pattern=url_pattern,
-                    error=str(e),
-                    node_id=self.node_config.id
-                )
-                # If regex is invalid, don't filter (capture all)
+            return False
         
         # Get HTTP method filter
-        http_methods = self.form.cleaned_data.get('http_methods', 'all')
-        if http_methods != 'all':
-            allowed_methods = [m.strip() for m in http_methods.split(',')]
-            if request.method not in allowed_methods:
+        allowed_methods = self._http_methods
+        if allowed_methods is not None and request.method not in allowed_methods:
+            if self._debug_enabled:
                 logger.debug(
                     "Request filtered by HTTP method",
                     url=request.url,
@@ -179,7 +367,19 @@ class NetworkInterceptor(BlockingNode):
                     allowed=allowed_methods,
                     node_id=self.node_config.id
                 )
-                return False
+            return False
+        
+        # Get URL pattern filter (regex last: the set checks above are cheaper)
+        url_re = self._url_re
+        if url_re is not None and not url_re.search(request.url):
+            if self._debug_enabled:
+                logger.debug(
+                    "Request filtered by URL pattern",
+                    url=request.url,
+                    pattern=url_re.pattern,
+                    node_id=self.node_config.id
+                )
+            return False
         
         return True
 
@@ -194,26 +394,17 @@ class NetworkInterceptor(BlockingNode):
             True if response should be captured, False otherwise
         """
         # Get status code filter
-        status_codes = self.form.cleaned_data.get('status_codes', '').strip()
-        if status_codes:
-            try:
-                allowed_codes = [int(c.strip()) for c in status_codes.split(',') if c.strip()]
-                if response.status not in allowed_codes:
-                    logger.debug(
-                        "Response filtered by status code",
-                        url=response.url,
-                        status=response.status,
-                        allowed=allowed_codes,
-                        node_id=self.node_config.id
-                    )
-                    return False
-            except ValueError:
-                logger.warning(
-                    "Invalid status code format",
-                    status_codes=status_codes,
+        allowed_codes = self._status_codes
+        if allowed_codes is not None and response.status not in allowed_codes:
+            if self._debug_enabled:
+                logger.debug(
+                    "Response filtered by status code",
+                    url=response.url,
+                    status=response.status,
+                    allowed=allowed_codes,
                     node_id=self.node_config.id
                 )
-                # If format is invalid, don't filter (capture all)
+            return False
         
         return True
 
@@ -231,14 +422,9 @@ class NetworkInterceptor(BlockingNode):
             True if response matches all applicable filters, False otherwise
         """
         # Check URL pattern filter
-        url_pattern = self.form.cleaned_data.get('url_pattern', '').strip()
-        if url_pattern:
-            try:
-                if not re.search(url_pattern, response.url):
-                    return False
-            except re.error:
-                # Invalid regex, don't filter (match all)
-                pass
+        url_re = self._url_re
+        if url_re is not None and not url_re.search(response.url):
+            return False
         
         # Check status code filter
         if not self._should_capture_response(response):
@@ -261,13 +447,10 @@ class NetworkInterceptor(BlockingNode):
             Parsed JSON dict, text string, or None on error/skip
         """
         # Check if body should be included
-        include_body = self.form.cleaned_data.get('include_response_body', 'true')
-        if include_body == 'false':
+        if not self._include_body:
             return None
         
-        # Get max size limit
-        max_size_str = self.form.cleaned_data.get('max_response_size', '10MB')
-        max_size_bytes = self._parse_response_size(max_size_str)
+        max_size_bytes = self._max_response_bytes
         
         # Check content-length header first if available
         content_length = response.headers.get('content-length')
@@ -303,13 +486,19 @@ class NetworkInterceptor(BlockingNode):
                 return None
             
             # Get content-type
-            content_type = response.headers.get('content-type', '').lower()
+            content_type = response.headers.get('content-type', '')
             
-            # Try to parse as JSON if content-type suggests it
-            if 'application/json' in content_type:
+            # Try to parse as JSON if content-type suggests it (case-insensitive, no lowered copy)
+            if _JSON_CONTENT_TYPE.search(content_type):
                 try:
+                    # orjson parses bytes directly, without decoding to str first
+                    return orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    pass
+                try:
+                    # stdlib json also accepts what orjson rejects (NaN, ints beyond 64 bits)
                     return json.loads(body.decode('utf-8'))
-                except json.JSONDecodeError:
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     # Fallback to text if JSON parsing fails
                     return body.decode('utf-8', errors='ignore')
             else:
@@ -325,49 +514,88 @@ class NetworkInterceptor(BlockingNode):
             )
             return None
 
+    def _request_data(self, request: Request) -> Optional[dict]:
+        """
+        Build the output dict for the request behind a matched response.
+        
+        Args:
+            request: Playwright Request that produced the matched response
+            
+        Returns:
+            Request data dict, or None if the request filters reject it
+        """
+        if not self._should_capture_request(request):
+            return None
+        # Request start time in epoch ms; -1 when the browser did not report it
+        start_ms = request.timing.get('startTime', -1)
+        return {
+            'url': request.url,
+            'method': request.method,
+            'headers': dict(request.headers),
+            'post_data': request.post_data,
+            'resource_type': request.resource_type,
+            'timestamp': start_ms / 1000.0 if start_ms > 0 else time.time()
+        }
+
+    async def _collect_network_requests(self, responses: List[Response]) -> List[dict]:
+        """
+        Build request/response entries for matched responses, fetching all bodies concurrently.
+        
+        Args:
+            responses: Matching Playwright Response objects, in match order
+            
+        Returns:
+            List of {"request": ..., "response": ...} dicts
+        """
+        bodies = await asyncio.gather(*(self._fetch_response_body(r) for r in responses))
+        return [
+            {
+                "request": self._request_data(response.request),
+                "response": {
+                    'url': response.url, 'status': response.status,
+                    'status_text': response.status_text, 'headers': dict(response.headers), 'body': body
+                },
+            }
+            for response, body in zip(responses, bodies)
+        ]
+
     async def _load_single_url_with_interception(self, url: str, context, resolved_session_id: str, pool_id: str) -> dict:
         page = None
         response_event = asyncio.Event()
-        matching_response: Optional[Response] = None
-        captured_requests: Dict[str, Dict[str, Any]] = {}
+        matching_responses: List[Response] = []
+        match_count = self._match_count
         goto_task = None
 
         try:
             respect_throttle = self.form.cleaned_data.get("respect_domain_throttle", True)
             if respect_throttle:
                 await wait_before_request(resolved_session_id, url, pool_id)
-            # Get timeout from form
-            return_timeout_str = self.form.cleaned_data.get('return_timeout', '30000')
-            try:
-                return_timeout_ms = int(return_timeout_str)
-            except (ValueError, TypeError):
-                return_timeout_ms = 30000  # Default to 30 seconds
-            
+            return_timeout_ms = self._return_timeout_ms
             timeout_seconds = return_timeout_ms / 1000.0 if return_timeout_ms > 0 else None
             goto_timeout_ms = return_timeout_ms if return_timeout_ms > 0 else 300000  # Long timeout when waiting indefinitely
 
             page = await context.new_page()
             
-            # Define request callback to track requests
-            def on_request(request: Request):
-                if self._should_capture_request(request):
-                    captured_requests[request.url] = {
-                        'url': request.url,
-                        'method': request.method,
-                        'headers': dict(request.headers),
-                        'post_data': request.post_data,
-                        'resource_type': request.resource_type,
-                        'timestamp': time.time()
-                    }
+            allowed_types = self._resource_types
+            if self._block_static and allowed_types is not None and not (allowed_types & _STATIC_RESOURCE_TYPES):
+                # Nothing static can be captured, so don't download it.
+                # Note: any route disables Playwright's HTTP cache for the page.
+                async def block_static(route):
+                    if route.request.resource_type in _STATIC_RESOURCE_TYPES:
+                        await route.abort()
+                    else:
+                        # Defer to context-level routes (session resource blocking)
+                        await route.fallback()
+                
+                await page.route(_STATIC_RESOURCE_GLOB, block_static)
             
-            # Define response callback that checks filters and sets event
+            # Define response callback that collects matches and sets event once enough are found
             def on_response(response: Response):
-                nonlocal matching_response
                 if not response_event.is_set() and self._response_matches_filters(response):
-                    matching_response = response
-                    response_event.set()
+                    matching_responses.append(response)
+                    if len(matching_responses) >= match_count:
+                        response_event.set()
             
-            page.on('request', on_request)
             page.on('response', on_response)
 
             # Start navigation in background (commit = minimal wait, page starts loading)
@@ -382,7 +610,7 @@ class NetworkInterceptor(BlockingNode):
                     return_when=asyncio.FIRST_COMPLETED
                 )
             else:
-                await response_event.wait()
+                await response_task
                 done, pending = {response_task}, set()
 
             # Cancel and await background goto to avoid pending-task warnings
@@ -394,32 +622,31 @@ class NetworkInterceptor(BlockingNode):
                 task.cancel()
                 await asyncio.gather(task, return_exceptions=True)
 
-            # Success: matching network response was found
+            responses = matching_responses[:match_count]
+
+            # Success: enough matching network responses were found
             if response_task in done and not response_task.cancelled():
                 if response_task.exception():
                     raise response_task.exception()
-                if matching_response is None:
+                if not responses:
                     raise Exception("Response event fired but no response object was captured.")
 
-                body = await self._fetch_response_body(matching_response)
-                response_data = {
-                    'url': matching_response.url, 'status': matching_response.status,
-                    'status_text': matching_response.status_text, 'headers': dict(matching_response.headers), 'body': body
-                }
-                request_data = captured_requests.get(matching_response.url)
-                
-                logger.info("Matching response found, returning immediately", url=url, response_url=matching_response.url, node_id=self.node_config.id)
+                logger.info("Matching response found, returning immediately", url=url, response_url=responses[0].url, matches=len(responses), node_id=self.node_config.id)
                 return {
                     "url": url, "final_url": page.url, "dom_content": None,
-                    "network_requests": [{"request": request_data, "response": response_data}]
+                    "network_requests": await self._collect_network_requests(responses)
                 }
 
-            # No matching response in time (timeout)
-            error_message = f"Timeout: No matching response found within {return_timeout_ms}ms."
+            # Not enough matching responses in time (timeout); keep any partial matches
+            if responses:
+                error_message = f"Timeout: Only {len(responses)} of {match_count} matching responses found within {return_timeout_ms}ms."
+            else:
+                error_message = f"Timeout: No matching response found within {return_timeout_ms}ms."
             logger.warning(error_message, url=url, timeout=return_timeout_ms, node_id=self.node_config.id)
             return {
                 "url": url, "final_url": page.url, "dom_content": None,
-                "network_requests": [], "error": error_message
+                "network_requests": await self._collect_network_requests(responses),
+                "error": error_message
             }
 
         except Exception as e:
@@ -464,10 +691,30 @@ class NetworkInterceptor(BlockingNode):
             include_response_body: Whether to capture response bodies (true/false).
             max_response_size: Maximum response size to capture (e.g., "10MB").
             return_timeout: Maximum time to wait for matching response in milliseconds.
+            block_static_resources: Abort image/font/media/stylesheet requests (opt-in).
+            max_concurrent_pages: Maximum number of pages loading at the same time.
+            match_count: Number of matching responses to capture per URL.
+            cache_ttl_seconds: Reuse a successful result for the same URL and settings
+                for this many seconds (0 disables caching).
         """
         session_name = self.form.cleaned_data.get("session_name", "default")
 
         urls = self._extract_urls(node_data)
+        self._url_re = self._compile_url_pattern()
+        self._resource_types = self._parse_choice_filter('capture_resource_types', 'xhr,fetch')
+        self._http_methods = self._parse_choice_filter('http_methods', 'all')
+        self._status_codes = self._parse_status_codes()
+        self._max_response_bytes = self._parse_response_size(
+            self.form.cleaned_data.get('max_response_size', '10MB')
+        )
+        self._return_timeout_ms = self._parse_return_timeout()
+        self._match_count = self._parse_match_count()
+        self._include_body = self.form.cleaned_data.get('include_response_body', 'true') != 'false'
+        self._block_static = bool(self.form.cleaned_data.get('block_static_resources', False))
+        # Filter hooks fire per sub-resource; skip building debug events nobody will see
+        self._debug_enabled = _stdlib_logger.isEnabledFor(logging.DEBUG)
+        cache_ttl = self._parse_cache_ttl()
+        cache_key_prefix = self._cache_key_prefix(session_name)
         domain = extract_domain_from_url(urls[0]) if urls else None
 
         logger.info(
@@ -478,18 +725,38 @@ class NetworkInterceptor(BlockingNode):
             node_id=self.node_config.id,
         )
 
-        context, resolved_session_id, pool_id = await self.browser_manager.get_context(session_name, domain=domain)
+        # Serve fresh cached results first; only the remaining URLs need the browser
+        results: List[Any] = [None] * len(urls)
+        pending_indexes = []
+        for i, url in enumerate(urls):
+            cached = _get_cached_result(cache_key_prefix + (url,), cache_ttl) if cache_ttl else None
+            if cached is not None:
+                logger.info("Using cached network interception result", url=url, node_id=self.node_config.id)
+                results[i] = cached
+            else:
+                pending_indexes.append(i)
 
-        tasks = [
-            self._load_single_url_with_interception(url, context, resolved_session_id, pool_id)
-            for url in urls
-        ]
-        
-        # Use asyncio.gather with return_exceptions to handle errors gracefully
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if pending_indexes:
+            context, resolved_session_id, pool_id = await self.browser_manager.get_context(session_name, domain=domain)
+
+            # Cap open pages so large URL batches don't thrash the browser
+            page_slots = asyncio.Semaphore(parse_max_concurrent_pages(self.form.cleaned_data))
+
+            async def load_limited(url: str) -> dict:
+                async with page_slots:
+                    return await self._load_single_url_with_interception(url, context, resolved_session_id, pool_id)
+
+            tasks = [load_limited(urls[i]) for i in pending_indexes]
+            
+            # Use asyncio.gather with return_exceptions to handle errors gracefully
+            fetched = await asyncio.gather(*tasks, return_exceptions=True)
+            for i, result in zip(pending_indexes, fetched):
+                results[i] = result
+                if cache_ttl and isinstance(result, dict) and result.get("network_requests") and not result.get("error"):
+                    _store_cached_result(cache_key_prefix + (urls[i],), result)
         
-        # Process results and format output
-        formatted_results = []
+        # Replace exceptions with error entries in place and tally outcomes in the same pass
+        successful = failed = 0
         for i, result in enumerate(results):
             if isinstance(result, Exception):
                 # Handle unexpected exceptions
@@ -499,27 +766,31 @@ class NetworkInterceptor(BlockingNode):
                     error=str(result),
                     node_id=self.node_config.id
                 )
-                formatted_results.append({
+                results[i] = {
                     "url": urls[i],
                     "final_url": None,
                     "dom_content": None,
                     "network_requests": [],
                     "error": str(result)
-                })
+                }
+                failed += 1
             else:
-                # Result is a dict from _load_single_url_with_interception
-                formatted_results.append(result)
+                # Result is a dict from _load_single_url_with_interception or the cache
+                if result.get("network_requests"):
+                    successful += 1
+                if result.get("error") is not None:
+                    failed += 1
         
         logger.info(
             "Network interception completed for all URLs",
-            total=len(formatted_results),
-            successful=sum(1 for r in formatted_results if len(r.get("network_requests", [])) > 0),
-            failed=sum(1 for r in formatted_results if r.get("error") is not None),
+            total=len(results),
+            successful=successful,
+            failed=failed,
             node_id=self.node_config.id
         )
         
         # Store results in the requested format
         output_key = self.get_unique_output_key(node_data, "network_interceptor")
-        node_data.data[output_key] = formatted_results
+        node_data.data[output_key] = results
 
         return node_data
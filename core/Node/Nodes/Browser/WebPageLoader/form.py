@@ -8,7 +8,7 @@ from django.forms import BooleanField, CharField, ChoiceField
 from django.forms.widgets import Textarea
 
 from ....Core.Form import BaseForm
-from .._shared.form_utils import BrowserSessionField
+from .._shared.form_utils import BrowserSessionField, MaxConcurrentPagesField
 
 
 class WebPageLoaderForm(BaseForm):
@@ -18,7 +18,7 @@ class WebPageLoaderForm(BaseForm):
         help_text=(
             "URLs to load (one per line, or leave empty to use 'urls' from input data). "
             "You can also use Jinja templates like {{ data.urls }}. "
-            "All URLs will be loaded in parallel."
+            "URLs are loaded in parallel, up to 'Max concurrent pages' at a time."
         )
     )
     session_name = BrowserSessionField()
@@ -39,3 +39,4 @@ class WebPageLoaderForm(BaseForm):
         help_text="When enabled, respects the browser session's settings (e.g. throttle delay) before each request. Disable to bypass for this node."
     )
 
+    max_concurrent_pages = MaxConcurrentPagesField()
@@ -14,6 +14,7 @@ from ....Core.Node.Core import BlockingNode, NodeOutput, PoolType
 from ....Core.Form import BaseForm
 from .form import WebPageLoaderForm
 from .._shared.BrowserManager import BrowserManager
+from .._shared.form_utils import parse_max_concurrent_pages
 from .._shared.services.session_resolver import extract_domain_from_url
 from apps.browsersession.services.domain_throttle_service import wait_before_request
 
@@ -167,6 +168,7 @@ class WebPageLoader(BlockingNode):
             urls: URLs to load (newline-separated string or Jinja template like {{ data.urls }}).
             session_name: Name of the persistent context session.
             wait_mode: Wait strategy ('load', 'domcontentloaded', or 'networkidle').
+            max_concurrent_pages: Maximum number of pages loading at the same time.
         """
         # Get configuration from form (rendered values)
         session_name = self.form.cleaned_data.get("session_name", "default")
@@ -190,11 +192,15 @@ class WebPageLoader(BlockingNode):
         # This ensures all pages are created from the same context
         context, resolved_session_id, pool_id = await self.browser_manager.get_context(session_name, domain=domain)
 
-        # Load all URLs in parallel using the shared context (use resolved_session_id + pool_id for throttle)
-        tasks = [
-            self._load_single_url(url, context, wait_mode, resolved_session_id, pool_id, respect_throttle)
-            for url in urls
-        ]
+        # Load URLs in parallel using the shared context (use resolved_session_id + pool_id for throttle),
+        # capping open pages so large URL batches don't thrash the browser
+        page_slots = asyncio.Semaphore(parse_max_concurrent_pages(self.form.cleaned_data))
+
+        async def load_limited(url: str) -> dict:
+            async with page_slots:
+                return await self._load_single_url(url, context, wait_mode, resolved_session_id, pool_id, respect_throttle)
+
+        tasks = [load_limited(url) for url in urls]
         
         # Use asyncio.gather with return_exceptions to handle errors gracefully
         results = await asyncio.gather(*tasks, return_exceptions=True)
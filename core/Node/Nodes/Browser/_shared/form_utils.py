@@ -1,9 +1,11 @@
 """Shared form utilities for browser-related nodes."""
 import re
-from django.forms import ChoiceField, ValidationError
+from django.forms import CharField, ChoiceField, ValidationError
 
 POOL_PREFIX = "pool:"
 
+DEFAULT_MAX_CONCURRENT_PAGES = 8
+
 # UUID v4 pattern (simple)
 _UUID_PATTERN = re.compile(
     r"^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$", re.I
@@ -71,3 +73,26 @@ class BrowserSessionField(ChoiceField):
             "Value must be pool:<uuid>. Direct session selection is not supported."
         )
 
+
+class MaxConcurrentPagesField(CharField):
+    """
+    CharField for the number of pages a multi-URL browser node loads at the same time.
+    Read the value with parse_max_concurrent_pages().
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('required', False)
+        kwargs.setdefault('initial', str(DEFAULT_MAX_CONCURRENT_PAGES))
+        kwargs.setdefault(
+            'help_text',
+            f"Maximum number of pages loading at the same time. Default: {DEFAULT_MAX_CONCURRENT_PAGES}."
+        )
+        super().__init__(*args, **kwargs)
+
+
+def parse_max_concurrent_pages(cleaned_data) -> int:
+    """Return max_concurrent_pages from cleaned form data: at least 1, default on empty/invalid."""
+    try:
+        return max(int(cleaned_data.get('max_concurrent_pages') or DEFAULT_MAX_CONCURRENT_PAGES), 1)
+    except (ValueError, TypeError):
+        return DEFAULT_MAX_CONCURRENT_PAGES
@@ -9,6 +9,7 @@ This service handles all interactions with Google Sheets and Drive APIs:
 - Read row data from a sheet (with optional header mapping)
 """
 
+import asyncio
 from typing import List, Tuple, Dict, Any, Optional
 import structlog
 from asgiref.sync import sync_to_async
@@ -214,12 +215,15 @@ class GoogleSheetsService:
         try:
             drive = await self._get_drive_service()
             
-            results = drive.files().list(
-                q="mimeType='application/vnd.google-apps.spreadsheet'",
-                fields="files(id, name)",
-                orderBy="modifiedTime desc",
-                pageSize=100
-            ).execute()
+            # execute() blocks on HTTP; keep it off the loop that form loaders share
+            results = await asyncio.to_thread(
+                drive.files().list(
+                    q="mimeType='application/vnd.google-apps.spreadsheet'",
+                    fields="files(id, name)",
+                    orderBy="modifiedTime desc",
+                    pageSize=100
+                ).execute
+            )
             
             files = results.get('files', [])
             
@@ -279,10 +283,12 @@ class GoogleSheetsService:
         try:
             sheets = await self._get_sheets_service()
             
-            spreadsheet = sheets.spreadsheets().get(
-                spreadsheetId=spreadsheet_id,
-                fields="sheets.properties"
-            ).execute()
+            spreadsheet = await asyncio.to_thread(
+                sheets.spreadsheets().get(
+                    spreadsheetId=spreadsheet_id,
+                    fields="sheets.properties"
+                ).execute
+            )
             
             sheet_list = spreadsheet.get('sheets', [])
             
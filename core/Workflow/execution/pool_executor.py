@@ -21,11 +21,11 @@ class PoolExecutor:
         self._max_workers_process = max_workers_process
     
     async def execute_in_pool(self, pool: PoolType, node: 'BaseNode', node_output: NodeOutput) -> NodeOutput:
-        if pool == PoolType.ASYNC:
+        if pool is PoolType.ASYNC:
             return await node.run(node_output)
-        elif pool == PoolType.THREAD:
+        elif pool is PoolType.THREAD:
             return await self._execute_thread(node, node_output)
-        elif pool == PoolType.PROCESS:
+        elif pool is PoolType.PROCESS:
             return await self._execute_process(node, node_output)
         else:
             raise ValueError(f"Unknown execution pool: {pool}")